@@ -1,7 +1,20 @@
 from abc import ABC, abstractmethod
+import logging
+import re
+import sys
 from typing import Any
 
 
+logger: logging.Logger = logging.getLogger(__name__)
+
+LOG_PATTERN: re.Pattern[str] = re.compile(r"^(ERROR|INFO)\b[: ]?\s*(.*)",
+                                          re.DOTALL)
+LOG_PREFIXES: dict[str, str] = {
+    "ERROR": "[ALERT] ERROR level detected: ",
+    "INFO": "[INFO] INFO level detected: "
+}
+
+
 class DataProcessor(ABC):
     """Abstract base class for processing different types of data.
 
@@ -9,6 +22,8 @@ class DataProcessor(ABC):
     process, and format output for various data types.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def process(self, data: Any) -> str:
         """Process the input data and return a string result.
@@ -52,6 +67,8 @@ class NumericProcessor(DataProcessor):
     like sum and average.
     """
 
+    __slots__ = ()
+
     def validate(self, data: Any) -> bool:
         """Validate that the data is a list of numeric values.
 
@@ -63,14 +80,12 @@ class NumericProcessor(DataProcessor):
         """
         try:
             len(data)
-            total: int = 0
-            for num in data:
-                total += num
+            sum(data)
         except (ValueError, TypeError, AttributeError):
-            print("Not list of numbers")
+            logger.debug("Not list of numbers")
             return False
 
-        print("Validation: Numeric data verified")
+        logger.debug("Validation: Numeric data verified")
         return True
 
     def process(self, data: Any) -> str:
@@ -84,8 +99,10 @@ class NumericProcessor(DataProcessor):
         """
         output: str
         try:
-            output = (f"Processed {len(data)} numeric values "
-                      f", sum={sum(data)}, avg={sum(data) / len(data)}")
+            count: int = len(data)
+            total: float = sum(data)
+            output = (f"Processed {count} numeric values "
+                      f", sum={total}, avg={total / count}")
         except (TypeError, ValueError, AttributeError) as e:
             output = f"Numeric Processor Error: {e}"
         return self.format_output(output)
@@ -97,6 +114,8 @@ class TextProcessor(DataProcessor):
     Validates and processes text strings, analyzing character and word counts.
     """
 
+    __slots__ = ()
+
     def validate(self, data: Any) -> bool:
         """Validate that the data is a string.
 
@@ -109,9 +128,9 @@ class TextProcessor(DataProcessor):
         try:
             data.capitalize()
         except (ValueError, TypeError, AttributeError):
-            print("Not a string")
+            logger.debug("Not a string")
             return False
-        print("Validation: Text data verified")
+        logger.debug("Validation: Text data verified")
         return True
 
     def process(self, data: Any) -> str:
@@ -140,8 +159,10 @@ class LogProcessor(DataProcessor):
     and formatting them appropriately.
     """
 
+    __slots__ = ()
+
     def validate(self, data: Any) -> bool:
-        """Validate that the data is a log entry with ERROR or INFO level.
+        """Validate that the data is a log entry starting with ERROR or INFO.
 
         Args:
             data: The data to validate.
@@ -150,11 +171,11 @@ class LogProcessor(DataProcessor):
             True if data is a valid log entry, False otherwise.
         """
         try:
-            if data.find("ERROR") > -1 or data.find("INFO") > -1:
-                print("Validation: Log entry verified")
+            if LOG_PATTERN.match(data) is not None:
+                logger.debug("Validation: Log entry verified")
                 return True
         except (TypeError, ValueError, AttributeError):
-            print("Not a log entry")
+            logger.debug("Not a log entry")
             return False
         return False
 
@@ -170,10 +191,9 @@ class LogProcessor(DataProcessor):
         output: str = ""
 
         try:
-            if data.find("ERROR") > -1:
-                output = "[ALERT] ERROR level detected: " + data[7:]
-            elif data.find("INFO") > -1:
-                output = "[INFO] INFO level detected: " + data[6:]
+            match = LOG_PATTERN.match(data)
+            if match is not None:
+                output = LOG_PREFIXES[match.group(1)] + match.group(2)
         except (TypeError, ValueError, AttributeError) as e:
             output = f"Log Processor Error: {e}"
         return self.format_output(output)
@@ -196,6 +216,10 @@ def main() -> None:
     Tests different processor implementations with various data types,
     showing validation, processing, and output formatting capabilities.
     """
+    # Validators log at DEBUG level; show their messages in the demo.
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s",
+                        stream=sys.stdout)
+
     print("Initializing Numeric Processor...")
     print("Processing data: [1, 2, 3, 4, 5]")
     lst: list[int] = [1, 2, 3, 4, 5]
@@ -2,6 +2,9 @@ from abc import ABC, abstractmethod
 from typing import Any, Dict  # typings are different in modern Python
 
 
+SENSOR_THRESHOLD: int = 30
+
+
 class DataStream(ABC):
     """Abstract base class for processing data streams.
 
@@ -9,6 +12,8 @@ class DataStream(ABC):
     process batches, filter data, and provide statistics.
     """
 
+    __slots__ = ("processed_count", "stream_id")
+
     def __init__(self, stream_id: str) -> None:
         """Initialize stream metadata and counters.
 
@@ -63,6 +68,8 @@ class SensorStream(DataStream):
     and provides filtering by high/standard values.
     """
 
+    __slots__ = ()
+
     def __init__(self, stream_id: str) -> None:
         """Initialize a sensor stream.
 
@@ -81,11 +88,12 @@ class SensorStream(DataStream):
             A string summary with reading count and average.
         """
         try:
-            average = sum(data_batch) / len(data_batch)
-            self.processed_count += len(data_batch)
+            count: int = len(data_batch)
+            average: float = sum(data_batch) / count
+            self.processed_count += count
             return (
                 f"[{self.stream_id}] "
-                f"{len(data_batch)} readings processed, avg: {average:.2f}"
+                f"{count} readings processed, avg: {average:.2f}"
             )
 
         except (TypeError, ZeroDivisionError):
@@ -106,9 +114,11 @@ class SensorStream(DataStream):
         """
         try:
             if criteria == "high":
-                return [data for data in data_batch if data > 30]
+                return [data for data in data_batch
+                        if data > SENSOR_THRESHOLD]
             elif criteria == "standard":
-                return [data for data in data_batch if data <= 30]
+                return [data for data in data_batch
+                        if data <= SENSOR_THRESHOLD]
         except TypeError:
             return data_batch
         return data_batch
@@ -133,6 +143,8 @@ class TransactionStream(DataStream):
     and provides filtering by positive/negative values.
     """
 
+    __slots__ = ()
+
     def __init__(self, stream_id: str) -> None:
         """Initialize a transaction stream.
 
@@ -151,11 +163,12 @@ class TransactionStream(DataStream):
             A string summary with operation count and net flow.
         """
         try:
+            count: int = len(data_batch)
             total = sum(data_batch)
-            self.processed_count += len(data_batch)
+            self.processed_count += count
             return (
                 f"[{self.stream_id}] "
-                f"{len(data_batch)} operations processed, net flow: {total}"
+                f"{count} operations processed, net flow: {total}"
             )
 
         except TypeError:
@@ -209,6 +222,8 @@ class EventStream(DataStream):
     and provides filtering by error/info events.
     """
 
+    __slots__ = ()
+
     def __init__(self, stream_id: str) -> None:
         """Initialize an event stream.
 
@@ -328,12 +343,13 @@ class StreamProcessor:
             return
 
         for stream in self.streams:
-            batch: list[Any] = data_map.get(stream.stream_id, [])
+            stream_id: str = stream.stream_id
+            batch: list[Any] = data_map.get(stream_id, [])
             try:
                 result: str = stream.process_batch(batch)
                 print(result)
             except (TypeError, ValueError) as e:
-                print(f"Processing error in {stream.stream_id}: {e}")
+                print(f"Processing error in {stream_id}: {e}")
 
     def filter_streams(
             self,
@@ -350,16 +366,14 @@ class StreamProcessor:
         """
 
         for stream in self.streams:
-            batch = data_map.get(stream.stream_id, [])
-            criteria = criteria_map.get(stream.stream_id)
+            stream_id: str = stream.stream_id
+            batch = data_map.get(stream_id, [])
+            criteria = criteria_map.get(stream_id)
             try:
                 filtered = stream.filter_data(batch, criteria)
-                print(
-                    f"{stream.stream_id}: "
-                    f"{len(filtered)} filtered item(s)"
-                )
+                print(f"{stream_id}: {len(filtered)} filtered item(s)")
             except (TypeError, ValueError) as e:
-                print(f"Filtering error in {stream.stream_id}: {e}")
+                print(f"Filtering error in {stream_id}: {e}")
 
 
 def main() -> None: